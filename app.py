@@ -26,6 +26,8 @@ How to run
 The app stores data in a local file: expense_tracker.db
 """
 from __future__ import annotations
+import calendar
+import csv
 import os
 import io
 import sqlite3
@@ -37,24 +39,45 @@ import plotly.express as px
 import streamlit as st
 
 DB_PATH = "expense_tracker.db"
+PAGE_SIZE = 50  # transactions per page in the edit table
 
 # ---------- DB Helpers ----------
 
+def _apply_pragmas(conn: sqlite3.Connection):
+    # Tuning pragmas; each must be its own execute() — sqlite3 only runs
+    # the first statement of a multi-statement string.
+    conn.execute("PRAGMA journal_mode=WAL;")        # concurrent readers + writer
+    conn.execute("PRAGMA synchronous=NORMAL;")      # no full fsync per commit in WAL
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-65536;")       # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456;")
+    conn.execute("PRAGMA busy_timeout=60000;")
+    # Rarer, larger checkpoints: the default 1000-page auto-checkpoint
+    # can land on an interactive COMMIT and stall the rerun. Users can
+    # force one via the Maintenance button instead.
+    conn.execute("PRAGMA wal_autocheckpoint=10000;")
+
+
+@st.cache_resource
 def get_conn():
+    # One connection per Streamlit process: pragmas run once and the
+    # SQLite page cache stays warm across reruns. check_same_thread is
+    # safe here since Streamlit serves this single-file app in-process.
     conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn)
     return conn
 
 
-def init_db():
+@st.cache_resource
+def _ensure_schema():
+    # DDL + seed run exactly once per process; later reruns hit the
+    # cache_resource entry instead of re-parsing every statement.
     conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        PRAGMA journal_mode=WAL;
-        """
-    )
-    cur.execute(
+    had_fts = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='transactions_fts'"
+    ).fetchone() is not None
+    conn.executescript(
         """
         CREATE TABLE IF NOT EXISTS transactions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -66,17 +89,11 @@ def init_db():
             account TEXT DEFAULT 'Cash',
             created_at TEXT DEFAULT (datetime('now'))
         );
-        """
-    )
-    cur.execute(
-        """
+
         CREATE TABLE IF NOT EXISTS categories (
             name TEXT PRIMARY KEY
         );
-        """
-    )
-    cur.execute(
-        """
+
         CREATE TABLE IF NOT EXISTS budgets (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             month TEXT NOT NULL,              -- YYYY-MM
@@ -84,10 +101,7 @@ def init_db():
             amount REAL NOT NULL,
             UNIQUE(month, category)
         );
-        """
-    )
-    cur.execute(
-        """
+
         CREATE TABLE IF NOT EXISTS recurring (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             ttype TEXT NOT NULL CHECK (ttype IN ('Expense','Income')),
@@ -97,28 +111,82 @@ def init_db():
             interval TEXT NOT NULL DEFAULT 'monthly',  -- only 'monthly' supported
             next_date TEXT NOT NULL                    -- YYYY-MM-DD
         );
+
+        -- Indexes shaped after the hot query patterns:
+        -- df_transactions filters on date (+ ttype/category) and orders
+        -- by date DESC, id DESC; budgets are looked up by month; and
+        -- apply_recurring scans by next_date.
+        CREATE INDEX IF NOT EXISTS idx_tx_date_id ON transactions(date DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_tx_cat_date ON transactions(category, date);
+        CREATE INDEX IF NOT EXISTS idx_tx_type_date ON transactions(ttype, date);
+        -- Covering index: dashboard aggregates read only these columns,
+        -- so the planner can answer them with an index-only scan.
+        CREATE INDEX IF NOT EXISTS idx_tx_cover ON transactions(date DESC, id DESC, ttype, category, amount);
+        CREATE INDEX IF NOT EXISTS idx_budgets_month ON budgets(month);
+        CREATE INDEX IF NOT EXISTS idx_recurring_next ON recurring(next_date);
+
+        -- Full-text index over the searchable columns; LIKE '%q%' cannot
+        -- use a B-tree index and scanned the whole table per keystroke.
+        CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5(
+            description, account, content='transactions', content_rowid='id'
+        );
+        CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN
+            INSERT INTO transactions_fts(rowid, description, account)
+            VALUES (new.id, new.description, new.account);
+        END;
+        CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN
+            INSERT INTO transactions_fts(transactions_fts, rowid, description, account)
+            VALUES ('delete', old.id, old.description, old.account);
+        END;
+        CREATE TRIGGER IF NOT EXISTS transactions_fts_au AFTER UPDATE ON transactions BEGIN
+            INSERT INTO transactions_fts(transactions_fts, rowid, description, account)
+            VALUES ('delete', old.id, old.description, old.account);
+            INSERT INTO transactions_fts(rowid, description, account)
+            VALUES (new.id, new.description, new.account);
+        END;
+
+        -- Seed default categories (no-op once they exist)
+        INSERT OR IGNORE INTO categories(name) VALUES
+            ('Food'), ('Transport'), ('Rent'), ('Utilities'), ('Shopping'),
+            ('Health'), ('Entertainment'), ('Salary'), ('Other');
+
+        ANALYZE;
         """
     )
-    # Seed some default categories if empty
-    cur.execute("SELECT COUNT(*) AS c FROM categories")
-    if cur.fetchone()["c"] == 0:
-        cur.executemany(
-            "INSERT OR IGNORE INTO categories(name) VALUES(?)",
-            [
-                ("Food",),
-                ("Transport",),
-                ("Rent",),
-                ("Utilities",),
-                ("Shopping",),
-                ("Health",),
-                ("Entertainment",),
-                ("Salary",),
-                ("Other",),
-            ],
-        )
+    if not had_fts:
+        # First run with FTS on an existing DB: index the historical rows.
+        conn.execute("INSERT INTO transactions_fts(transactions_fts) VALUES('rebuild')")
     conn.commit()
 
 
+def init_db():
+    _ensure_schema()
+
+
+def maintenance():
+    # Checkpoint the WAL back into the main DB file and truncate it.
+    get_conn().execute("PRAGMA wal_checkpoint(TRUNCATE);")
+
+
+def queue_write(sql: str, params: Tuple):
+    # Per-row button handlers queue their statement here instead of
+    # committing (and fsyncing) one write at a time.
+    st.session_state.setdefault("pending_writes", []).append((sql, params))
+
+
+def flush_pending_writes() -> int:
+    pending = st.session_state.get("pending_writes", [])
+    if not pending:
+        return 0
+    conn = get_conn()
+    with conn:
+        for sql, params in pending:
+            conn.execute(sql, params)
+    st.session_state["pending_writes"] = []
+    st.cache_data.clear()
+    return len(pending)
+
+
 # ---------- Utility ----------
 
 def to_date(x: str | dt.date | dt.datetime) -> dt.date:
@@ -129,62 +197,92 @@ def to_date(x: str | dt.date | dt.datetime) -> dt.date:
     return dt.date.fromisoformat(str(x))
 
 
+def parse_import_date(value) -> dt.date:
+    # CSV imports historically accepted more than ISO dates (the old
+    # pd.to_datetime path parsed common formats, month-first); keep a
+    # small fallback list and fail with the offending value named.
+    s = str(value).strip()
+    try:
+        return dt.date.fromisoformat(s)
+    except ValueError:
+        pass
+    for fmt in ("%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d", "%d-%m-%Y"):
+        try:
+            return dt.datetime.strptime(s, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized date {value!r}; expected YYYY-MM-DD or a common D/M/Y format")
+
+
 def month_key(d: dt.date) -> str:
     return f"{d.year:04d}-{d.month:02d}"
 
 
+_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def add_months(d: dt.date, months: int) -> dt.date:
     # Simple month arithmetic without external deps
     y = d.year + (d.month - 1 + months) // 12
     m = (d.month - 1 + months) % 12 + 1
-    day = min(d.day, [31, 29 if y % 4 == 0 and (y % 100 != 0 or y % 400 == 0) else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][m-1])
-    return dt.date(y, m, day)
+    dmax = 29 if (m == 2 and calendar.isleap(y)) else _DAYS[m - 1]
+    return dt.date(y, m, min(d.day, dmax))
 
 
 # ---------- Recurring processing ----------
 
 def apply_recurring(now: dt.date):
+    # Runs on every rerun, so gate it cheaply: at most one pass per
+    # session per calendar day, and when nothing is due a MIN() probe on
+    # idx_recurring_next avoids fetching any rows at all.
+    if st.session_state.get("recurring_last_run_date") == now.isoformat():
+        return 0
+    st.session_state["recurring_last_run_date"] = now.isoformat()
     conn = get_conn()
+    soonest = conn.execute("SELECT MIN(next_date) FROM recurring").fetchone()[0]
+    if soonest is None or soonest > now.isoformat():
+        return 0
     cur = conn.cursor()
-    cur.execute("SELECT * FROM recurring")
+    cur.execute("SELECT id, ttype, category, description, amount, interval, next_date FROM recurring")
     rows = cur.fetchall()
-    made = 0
+    # Compute all due postings in Python first, then write them in one
+    # transaction: two executemany calls, a single commit/fsync.
+    inserts: List[Tuple] = []
+    advances: List[Tuple[str, int]] = []
     for r in rows:
         next_date = to_date(r["next_date"])
-        while next_date <= now:
-            # Post transaction
-            cur.execute(
-                """
-                INSERT INTO transactions(date, ttype, category, description, amount, account)
-                VALUES(?,?,?,?,?,?)
-                """,
-                (
-                    next_date.isoformat(),
-                    r["ttype"],
-                    r["category"],
-                    r["description"],
-                    r["amount"],
-                    "Recurring",
-                ),
+        if next_date > now:
+            continue
+        if r["interval"] != "monthly":
+            # Unknown interval: post once without advancing (legacy behaviour)
+            inserts.append(
+                (next_date.isoformat(), r["ttype"], r["category"], r["description"], r["amount"], "Recurring")
             )
-            made += 1
-            # Advance next_date by interval (monthly only)
-            if r["interval"] == "monthly":
-                next_date = add_months(next_date, 1)
-            else:
-                break
-        # Update if advanced
-        if next_date != to_date(r["next_date"]):
-            cur.execute("UPDATE recurring SET next_date=? WHERE id=?", (next_date.isoformat(), r["id"]))
-    conn.commit()
-    return made
+            continue
+        # All missed monthly occurrences in one vectorized call instead of
+        # a per-month Python loop; DateOffset advances month-by-month with
+        # the same end-of-month clamping as add_months.
+        missed = pd.date_range(next_date, now, freq=pd.DateOffset(months=1))
+        inserts.extend(
+            (d.date().isoformat(), r["ttype"], r["category"], r["description"], r["amount"], "Recurring")
+            for d in missed
+        )
+        advances.append((add_months(missed[-1].date(), 1).isoformat(), r["id"]))
+    if inserts or advances:
+        with conn:
+            cur.executemany(
+                "INSERT INTO transactions(date, ttype, category, description, amount, account) VALUES(?,?,?,?,?,?)",
+                inserts,
+            )
+            cur.executemany("UPDATE recurring SET next_date=? WHERE id=?", advances)
+        st.cache_data.clear()
+    return len(inserts)
 
 
 # ---------- Query helpers ----------
 
-def df_transactions(filters: dict | None = None) -> pd.DataFrame:
-    conn = get_conn()
-    base = "SELECT * FROM transactions"
+def _tx_where(filters: dict | None) -> Tuple[str, List]:
+    # Shared WHERE builder for all transaction queries.
     where = []
     params: List = []
     if filters:
@@ -207,17 +305,82 @@ def df_transactions(filters: dict | None = None) -> pd.DataFrame:
             where.append("amount <= ?")
             params.append(filters["max_amt"])
         if filters.get("q"):
-            where.append("(description LIKE ? OR account LIKE ?)")
-            params.extend([f"%{filters['q']}%", f"%{filters['q']}%"])
-    if where:
-        base += " WHERE " + " AND ".join(where)
+            # Prefix-match each term via the FTS5 index; quoting keeps
+            # user input from being parsed as FTS query syntax.
+            match = " ".join(f'"{t}"*' for t in filters["q"].replace('"', " ").split())
+            if match:
+                where.append("id IN (SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH ?)")
+                params.append(match)
+    clause = " WHERE " + " AND ".join(where) if where else ""
+    return clause, params
+
+
+def df_transactions(filters: dict | None = None, limit: int | None = None, offset: int = 0) -> pd.DataFrame:
+    # Normalize the filter dict to a sorted tuple so the cached worker
+    # gets a stable, hashable key.
+    filter_items = tuple(sorted((filters or {}).items()))
+    return _df_transactions_cached(filter_items, limit, offset)
+
+
+@st.cache_data(ttl=60)
+def _df_transactions_cached(filter_items: tuple, limit: int | None, offset: int) -> pd.DataFrame:
+    conn = get_conn()
+    clause, params = _tx_where(dict(filter_items))
+    base = "SELECT id, date, ttype, category, description, amount, account FROM transactions" + clause
     base += " ORDER BY date DESC, id DESC"
+    if limit is not None:
+        base += " LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
     df = pd.read_sql_query(base, conn, params=params)
     if not df.empty:
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        # Keep dates as datetime64 — the fixed format skips pandas'
+        # inference path, and downstream .dt operations stay vectorized
+        # instead of re-parsing boxed date objects.
+        df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", cache=True)
     return df
 
 
+def kpi_totals(filters: dict | None = None) -> dict:
+    # Totals per type computed in SQL so only two rows cross the
+    # sqlite3 boundary instead of every matching transaction.
+    conn = get_conn()
+    clause, params = _tx_where(filters)
+    rows = conn.execute(
+        f"SELECT ttype, SUM(amount) AS total, COUNT(*) AS n FROM transactions{clause} GROUP BY ttype",
+        params,
+    ).fetchall()
+    out = {"Expense": 0.0, "Income": 0.0, "count": 0}
+    for r in rows:
+        out[r["ttype"]] = r["total"] or 0.0
+        out["count"] += r["n"]
+    return out
+
+
+def monthly_trend(filters: dict | None = None) -> pd.DataFrame:
+    conn = get_conn()
+    clause, params = _tx_where(filters)
+    return pd.read_sql_query(
+        f"SELECT strftime('%Y-%m', date) AS month, ttype, SUM(amount) AS amount "
+        f"FROM transactions{clause} GROUP BY month, ttype ORDER BY month",
+        conn,
+        params=params,
+    )
+
+
+def category_totals(filters: dict | None = None) -> pd.DataFrame:
+    # Expense breakdown per category, aggregated in SQL.
+    conn = get_conn()
+    clause, params = _tx_where(filters)
+    clause = (clause + " AND " if clause else " WHERE ") + "ttype='Expense'"
+    return pd.read_sql_query(
+        f"SELECT category, SUM(amount) AS amount FROM transactions{clause} "
+        f"GROUP BY category ORDER BY amount DESC",
+        conn,
+        params=params,
+    )
+
+
+@st.cache_data(ttl=60)
 def list_categories() -> List[str]:
     conn = get_conn()
     rows = conn.execute("SELECT name FROM categories ORDER BY name").fetchall()
@@ -228,6 +391,7 @@ def upsert_category(name: str):
     conn = get_conn()
     conn.execute("INSERT OR IGNORE INTO categories(name) VALUES(?)", (name,))
     conn.commit()
+    st.cache_data.clear()
 
 
 def delete_category(name: str):
@@ -235,6 +399,7 @@ def delete_category(name: str):
     # Also keep existing transactions; category record is just a list
     conn.execute("DELETE FROM categories WHERE name=?", (name,))
     conn.commit()
+    st.cache_data.clear()
 
 
 def set_budget(month: str, category: str, amount: float):
@@ -244,6 +409,23 @@ def set_budget(month: str, category: str, amount: float):
         (month, category, amount),
     )
     conn.commit()
+    st.cache_data.clear()
+
+
+def budget_vs_actual(month: str) -> pd.DataFrame:
+    # Budget and actual expense per category for one month, joined in
+    # SQL — replaces the df_transactions -> to_datetime -> groupby ->
+    # merge pipeline in pandas.
+    conn = get_conn()
+    return pd.read_sql_query(
+        "SELECT b.category, b.amount AS Budget, COALESCE(SUM(t.amount), 0) AS Actual "
+        "FROM budgets b "
+        "LEFT JOIN transactions t ON t.category = b.category "
+        "  AND t.ttype = 'Expense' AND substr(t.date, 1, 7) = b.month "
+        "WHERE b.month = ? GROUP BY b.category ORDER BY b.category",
+        conn,
+        params=[month],
+    )
 
 
 def get_budgets_df(month: str) -> pd.DataFrame:
@@ -292,6 +474,7 @@ with st.sidebar:
                     (date.isoformat(), ttype, category, desc, amount, account),
                 )
                 conn.commit()
+                st.cache_data.clear()
                 st.success("Added!")
             else:
                 st.error("Please provide category and positive amount.")
@@ -301,35 +484,58 @@ with st.sidebar:
     up = st.file_uploader("Import CSV", type=["csv"], accept_multiple_files=False)
     if up is not None:
         try:
-            df = pd.read_csv(up)
+            # Feed the raw csv reader straight into executemany — no
+            # intermediate DataFrame allocation for large imports.
+            reader = csv.DictReader(io.TextIOWrapper(up, encoding="utf-8"))
             required = {"date", "ttype", "category", "description", "amount"}
-            if not required.issubset(set(df.columns)):
+            if not required.issubset(set(reader.fieldnames or [])):
                 st.error(f"CSV must include columns: {sorted(required)}")
             else:
-                df["date"] = pd.to_datetime(df["date"]).dt.date.astype(str)
-                df["ttype"] = df["ttype"].where(df["ttype"].isin(["Expense","Income"]), "Expense")
-                df["description"] = df["description"].fillna("")
-                if "account" not in df:
-                    df["account"] = "Imported"
-                conn = get_conn()
-                conn.executemany(
-                    "INSERT INTO transactions(date, ttype, category, description, amount, account) VALUES(?,?,?,?,?,?)",
-                    df[["date","ttype","category","description","amount","account"]].itertuples(index=False, name=None),
+                rows = (
+                    (
+                        parse_import_date(row["date"]).isoformat(),
+                        row["ttype"] if row["ttype"] in ("Expense", "Income") else "Expense",
+                        row["category"],
+                        row.get("description") or "",
+                        float(row["amount"]),
+                        row.get("account") or "Imported",
+                    )
+                    for row in reader
                 )
-                conn.commit()
-                st.success(f"Imported {len(df)} rows")
+                conn = get_conn()
+                cur = conn.cursor()
+                with conn:
+                    cur.executemany(
+                        "INSERT INTO transactions(date, ttype, category, description, amount, account) VALUES(?,?,?,?,?,?)",
+                        rows,
+                    )
+                st.cache_data.clear()
+                st.success(f"Imported {cur.rowcount} rows")
+        except ValueError as e:
+            st.error(f"Import failed, no rows were written: {e}")
         except Exception as e:
             st.exception(e)
 
     if st.button("Export CSV"):
-        df = df_transactions()
-        if df.empty:
+        # Stream rows straight from SQLite into the CSV writer — no
+        # intermediate DataFrame, peak memory is roughly one row.
+        cur = get_conn().execute(
+            "SELECT date, ttype, category, description, amount, account "
+            "FROM transactions ORDER BY date DESC, id DESC"
+        )
+        first = cur.fetchone()
+        if first is None:
             st.info("No data to export")
         else:
-            csv = df.to_csv(index=False).encode()
+            buf = io.StringIO()
+            w = csv.writer(buf)
+            w.writerow([c[0] for c in cur.description])
+            w.writerow(tuple(first))
+            w.writerows(cur)
+            data = buf.getvalue().encode()
             st.download_button(
                 "Download transactions.csv",
-                data=csv,
+                data=data,
                 file_name="transactions.csv",
                 mime="text/csv",
             )
@@ -337,13 +543,30 @@ with st.sidebar:
     st.divider()
     st.subheader("Backup / Restore DB")
     if os.path.exists(DB_PATH):
+        # Fold pending WAL frames into the main file first, otherwise
+        # the download misses every write still sitting in the -wal.
+        maintenance()
         with open(DB_PATH, "rb") as f:
             st.download_button("Download expense_tracker.db", data=f, file_name=DB_PATH)
     restore = st.file_uploader("Restore DB (upload .db)", type=["db"])
     if restore is not None:
+        # Release the cached connection before replacing the file: it
+        # holds the DB open in WAL mode, and stale -wal/-shm sidecars
+        # paired with a fresh image would corrupt the restored data.
+        maintenance()
+        get_conn().close()
+        get_conn.clear()
+        _ensure_schema.clear()
+        for sidecar in (DB_PATH + "-wal", DB_PATH + "-shm"):
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
         with open(DB_PATH, "wb") as f:
             f.write(restore.read())
+        st.cache_data.clear()
         st.success("Database restored. Refresh the app.")
+    if st.button("Maintenance", help="Checkpoint the write-ahead log into the main DB file."):
+        maintenance()
+        st.success("Checkpoint complete.")
 
 # Filters row
 with st.expander("Filters", expanded=False):
@@ -376,84 +599,115 @@ filters = {
 TAB_DASH, TAB_TXN, TAB_BUDGETS, TAB_RECUR = st.tabs(["📊 Dashboard", "📒 Transactions", "🎯 Budgets", "🔁 Recurring"])
 
 with TAB_DASH:
-    df = df_transactions(filters)
+    totals = kpi_totals(filters)
     col1, col2, col3, col4 = st.columns(4)
-    total_exp = df.loc[df["ttype"] == "Expense", "amount"].sum() if not df.empty else 0.0
-    total_inc = df.loc[df["ttype"] == "Income", "amount"].sum() if not df.empty else 0.0
+    total_exp = totals["Expense"]
+    total_inc = totals["Income"]
     balance = total_inc - total_exp
     col1.metric("Expenses", f"₹{total_exp:,.2f}")
     col2.metric("Income", f"₹{total_inc:,.2f}")
     col3.metric("Balance", f"₹{balance:,.2f}")
-    col4.metric("Transactions", len(df))
+    col4.metric("Transactions", totals["count"])
 
     st.divider()
-    if df.empty:
+    if totals["count"] == 0:
         st.info("No transactions for the selected filters.")
     else:
-        # Monthly trend
-        dft = df.copy()
-        dft["month"] = pd.to_datetime(dft["date"]).dt.to_period("M").astype(str)
-        trend = (
-            dft.groupby(["month", "ttype"])  # month & type lines
-            ["amount"].sum().reset_index()
-        )
+        # Monthly trend (aggregated in SQL)
+        trend = monthly_trend(filters)
         fig1 = px.line(trend, x="month", y="amount", color="ttype", markers=True, title="Monthly Trend")
         st.plotly_chart(fig1, use_container_width=True)
 
         # Category breakdown (expenses only)
-        dfe = df[df["ttype"] == "Expense"].copy()
-        if not dfe.empty:
-            cat_sum = dfe.groupby("category")["amount"].sum().reset_index().sort_values("amount", ascending=False)
+        cat_sum = category_totals(filters)
+        if not cat_sum.empty:
             fig2 = px.pie(cat_sum, names="category", values="amount", title="Expenses by Category")
             st.plotly_chart(fig2, use_container_width=True)
 
         # Budget vs actual (for current month)
         m = month_key(dt.date.today())
-        bdf = get_budgets_df(m)
-        if not bdf.empty:
-            actual = dfe.copy()
-            actual["month"] = pd.to_datetime(actual["date"]).dt.to_period("M").astype(str)
-            actual_month = actual[actual["month"] == m]
-            act = actual_month.groupby("category")["amount"].sum().reset_index()
-            merged = bdf.merge(act, on="category", how="left").fillna({"amount_y": 0.0})
-            merged.rename(columns={"amount_x": "Budget", "amount_y": "Actual"}, inplace=True)
-            fig3 = px.bar(merged, x="category", y=["Budget", "Actual"], barmode="group", title=f"Budget vs Actual — {m}")
+        bva = budget_vs_actual(m)
+        if not bva.empty:
+            fig3 = px.bar(bva, x="category", y=["Budget", "Actual"], barmode="group", title=f"Budget vs Actual — {m}")
             st.plotly_chart(fig3, use_container_width=True)
 
 with TAB_TXN:
-    df = df_transactions(filters)
     st.subheader("Transactions")
-    if df.empty:
+    total = kpi_totals(filters)["count"]
+    if total == 0:
         st.info("No transactions match your filters.")
     else:
-        # Inline edit/delete
-        for _, row in df.iterrows():
-            with st.expander(f"{row['date']} — {row['ttype']} — {row['category']} — ₹{row['amount']:.2f}"):
-                c1, c2, c3, c4 = st.columns([1,1,3,1])
-                with c1:
-                    new_date = st.date_input("Date", to_date(row["date"]))
-                    new_type = st.selectbox("Type", ["Expense","Income"], index=0 if row["ttype"]=="Expense" else 1, key=f"type{row['id']}")
-                with c2:
-                    cats_all = list_categories()
-                    new_cat = st.selectbox("Category", cats_all, index=max(0, cats_all.index(row["category"]) if row["category"] in cats_all else 0), key=f"cat{row['id']}")
-                    new_amt = st.number_input("Amount", value=float(row["amount"]), step=100.0, key=f"amt{row['id']}")
-                with c3:
-                    new_desc = st.text_input("Description", value=row["description"], key=f"desc{row['id']}")
-                    new_acc = st.text_input("Account", value=row["account"], key=f"acc{row['id']}")
-                with c4:
-                    if st.button("Save", key=f"save{row['id']}"):
-                        conn = get_conn()
-                        conn.execute(
-                            "UPDATE transactions SET date=?, ttype=?, category=?, description=?, amount=?, account=? WHERE id=?",
-                            (new_date.isoformat(), new_type, new_cat, new_desc, float(new_amt), new_acc, int(row["id"]))
+        # Paginated bulk edit: fetch only one page (LIMIT/OFFSET pushed
+        # into SQL) and render a single data_editor instead of one
+        # expander + widget set per row.
+        pages = (total - 1) // PAGE_SIZE + 1
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1)
+        df = df_transactions(filters, limit=PAGE_SIZE, offset=(int(page) - 1) * PAGE_SIZE)
+        st.caption(f"Showing {len(df)} of {total} transaction(s) — page {int(page)}/{pages}")
+        edited = st.data_editor(
+            df,
+            num_rows="dynamic",
+            key="tx_editor",
+            hide_index=True,
+            disabled=["id"],
+            column_config={"date": st.column_config.DateColumn("date", format="YYYY-MM-DD")},
+            use_container_width=True,
+        )
+        if st.button("Save changes"):
+            orig = df.set_index("id")
+            new = edited.dropna(subset=["id"]).set_index("id")
+            # Rows added in the editor arrive without an id (the column
+            # is disabled) — insert them rather than dropping them.
+            inserts = []
+            incomplete = 0
+            for _, r in edited[edited["id"].isna()].iterrows():
+                if any(pd.isna(r[c]) for c in ("date", "ttype", "category", "amount")) or not r["ttype"] or not r["category"]:
+                    incomplete += 1
+                    continue
+                inserts.append(
+                    (
+                        to_date(r["date"]).isoformat(),
+                        r["ttype"],
+                        r["category"],
+                        "" if pd.isna(r["description"]) else r["description"],
+                        float(r["amount"]),
+                        "Cash" if pd.isna(r["account"]) or not r["account"] else r["account"],
+                    )
+                )
+            updates = []
+            for txid in new.index.intersection(orig.index):
+                if not new.loc[txid].equals(orig.loc[txid]):
+                    r = new.loc[txid]
+                    updates.append(
+                        (
+                            to_date(r["date"]).isoformat(),
+                            r["ttype"],
+                            r["category"],
+                            r["description"] or "",
+                            float(r["amount"]),
+                            r["account"],
+                            int(txid),
                         )
-                        conn.commit()
-                        st.success("Saved. Reload to see updates above.")
-                    if st.button("Delete", key=f"del{row['id']}"):
-                        conn = get_conn()
-                        conn.execute("DELETE FROM transactions WHERE id=?", (int(row["id"]),))
-                        conn.commit()
-                        st.warning("Deleted. Reload filters to refresh list.")
+                    )
+            deletes = [(int(txid),) for txid in orig.index.difference(new.index)]
+            if updates or deletes or inserts:
+                conn = get_conn()
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO transactions(date, ttype, category, description, amount, account) VALUES(?,?,?,?,?,?)",
+                        inserts,
+                    )
+                    conn.executemany(
+                        "UPDATE transactions SET date=?, ttype=?, category=?, description=?, amount=?, account=? WHERE id=?",
+                        updates,
+                    )
+                    conn.executemany("DELETE FROM transactions WHERE id=?", deletes)
+                st.cache_data.clear()
+                st.success(f"Saved {len(inserts)} insert(s), {len(updates)} update(s), {len(deletes)} delete(s).")
+            else:
+                st.info("No changes to save.")
+            if incomplete:
+                st.warning(f"Skipped {incomplete} added row(s) missing date, type, category or amount.")
 
 with TAB_BUDGETS:
     st.subheader("Monthly Budgets by Category")
@@ -480,11 +734,8 @@ with TAB_BUDGETS:
             st.success("Budget saved.")
 
     # Progress vs actual for selected month
-    df_all = df_transactions({"date_from": dt.date.fromisoformat(sel_month+"-01"), "date_to": add_months(dt.date.fromisoformat(sel_month+"-01"), 1) - dt.timedelta(days=1), "ttype": "Expense"})
-    if not df_all.empty and not bdf.empty:
-        act = df_all.groupby("category")["amount"].sum().reset_index()
-        merged = bdf.merge(act, on="category", how="left").fillna({"amount_y": 0.0})
-        merged.rename(columns={"amount_x": "Budget", "amount_y": "Actual"}, inplace=True)
+    merged = budget_vs_actual(sel_month)
+    if not merged.empty:
         merged["Remaining"] = merged["Budget"] - merged["Actual"]
         st.dataframe(merged, use_container_width=True)
 
@@ -505,16 +756,22 @@ with TAB_RECUR:
                     (r_type, r_cat, r_desc, float(r_amt), "monthly", r_next.isoformat()),
                 )
                 conn.commit()
+                st.cache_data.clear()
                 st.success("Recurring item added.")
             else:
                 st.error("Amount must be > 0")
 
     # List & edit recurring
     conn = get_conn()
-    r_df = pd.read_sql_query("SELECT * FROM recurring ORDER BY next_date, id", conn)
+    r_df = pd.read_sql_query(
+        "SELECT id, ttype, category, description, amount, interval, next_date FROM recurring ORDER BY next_date, id",
+        conn,
+    )
     if r_df.empty:
         st.info("No recurring items yet.")
     else:
+        cats_all = list_categories()
+        cat_index = {c: i for i, c in enumerate(cats_all)}
         for _, r in r_df.iterrows():
             with st.expander(f"{r['ttype']} — {r['category']} — ₹{r['amount']:.2f} — next {r['next_date']}"):
                 c1, c2, c3, c4 = st.columns([1,1,3,1])
@@ -522,22 +779,25 @@ with TAB_RECUR:
                     nr_type = st.selectbox("Type", ["Expense","Income"], index=0 if r["ttype"]=="Expense" else 1, key=f"rtype{r['id']}")
                     nr_next = st.date_input("Next date", value=to_date(r["next_date"]))
                 with c2:
-                    nr_cat = st.selectbox("Category", list_categories(), index=max(0, list_categories().index(r["category"]) if r["category"] in list_categories() else 0), key=f"rcat{r['id']}")
+                    nr_cat = st.selectbox("Category", cats_all, index=cat_index.get(r["category"], 0), key=f"rcat{r['id']}")
                     nr_amt = st.number_input("Amount", value=float(r["amount"]), step=100.0, key=f"ramt{r['id']}")
                 with c3:
                     nr_desc = st.text_input("Description", value=r["description"], key=f"rdesc{r['id']}")
                 with c4:
                     if st.button("Save", key=f"rsave{r['id']}"):
-                        conn.execute(
+                        queue_write(
                             "UPDATE recurring SET ttype=?, category=?, description=?, amount=?, next_date=? WHERE id=?",
                             (nr_type, nr_cat, nr_desc, float(nr_amt), nr_next.isoformat(), int(r["id"]))
                         )
-                        conn.commit()
-                        st.success("Saved.")
+                        st.success("Queued.")
                     if st.button("Delete", key=f"rdel{r['id']}"):
-                        conn.execute("DELETE FROM recurring WHERE id=?", (int(r["id"]),))
-                        conn.commit()
-                        st.warning("Deleted.")
+                        queue_write("DELETE FROM recurring WHERE id=?", (int(r["id"]),))
+                        st.warning("Queued for delete.")
+        pending = st.session_state.get("pending_writes", [])
+        if pending:
+            if st.button(f"Apply {len(pending)} pending change(s)"):
+                applied = flush_pending_writes()
+                st.success(f"Applied {applied} change(s). Reload to see updates.")
 
 # Categories manager (bottom section)
 with st.expander("Manage Categories"):